@@ -1,6 +1,8 @@
 """Component to interface with locks that can be controlled remotely."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import IntFlag
@@ -62,10 +64,60 @@ class LockEntityFeature(IntFlag):
 SUPPORT_OPEN = 1
 
 PROP_TO_ATTR = {"changed_by": ATTR_CHANGED_BY, "code_format": ATTR_CODE_FORMAT}
+_STATE_PROPERTIES = ("is_jammed", "is_locking", "is_unlocking", "is_locked")
+
+_SERVICE_TO_METHOD = {
+    SERVICE_LOCK: "async_lock",
+    SERVICE_UNLOCK: "async_unlock",
+    SERVICE_OPEN: "async_open",
+}
+
+# Matches code formats like ^\d{4}$ or ^\d{4,8}$
+_DIGITS_CODE_FORMAT = re.compile(r"\^\\d\{(\d+)(?:,(\d+))?\}\$")
 
 # mypy: disallow-any-generics
 
 
+@ft.lru_cache(maxsize=64)
+def _compile_code_format(code_format: str) -> re.Pattern[str]:
+    """Compile a code format, sharing the result between entities."""
+    return re.compile(code_format)
+
+
+@ft.lru_cache(maxsize=64)
+def _code_format_matcher(code_format: str) -> Callable[[str], object]:
+    """Return a function which checks if a code matches a code format.
+
+    Digit-only formats with a fixed or bounded length are checked without
+    using the regex engine, giving the same result as Pattern.match.
+    """
+    # Compile also when not needed to raise on invalid code formats
+    pattern = _compile_code_format(code_format)
+    if digits_match := _DIGITS_CODE_FORMAT.fullmatch(code_format):
+        min_length = int(digits_match[1])
+        max_length = int(digits_match[2]) if digits_match[2] else min_length
+
+        def _match_digits(code: str) -> bool:
+            # $ also matches before a trailing newline
+            if code.endswith("\n"):
+                code = code[:-1]
+            return min_length <= len(code) <= max_length and (
+                code.isdecimal() or not code
+            )
+
+        return _match_digits
+    return pattern.match
+
+
+def _executor_job(
+    method: Callable[..., None], kwargs: dict[str, Any]
+) -> Callable[[], None]:
+    """Return a job calling method with kwargs, avoiding a partial without kwargs."""
+    if kwargs:
+        return ft.partial(method, **kwargs)
+    return method
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Track states and offer events for locks."""
     component = hass.data[DOMAIN] = EntityComponent[LockEntity](
@@ -75,13 +127,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     await component.async_setup(config)
 
     component.async_register_entity_service(
-        SERVICE_UNLOCK, LOCK_SERVICE_SCHEMA, _async_unlock
+        SERVICE_UNLOCK, LOCK_SERVICE_SCHEMA, _async_service
     )
     component.async_register_entity_service(
-        SERVICE_LOCK, LOCK_SERVICE_SCHEMA, _async_lock
+        SERVICE_LOCK, LOCK_SERVICE_SCHEMA, _async_service
     )
     component.async_register_entity_service(
-        SERVICE_OPEN, LOCK_SERVICE_SCHEMA, _async_open, [LockEntityFeature.OPEN]
+        SERVICE_OPEN, LOCK_SERVICE_SCHEMA, _async_service, [LockEntityFeature.OPEN]
     )
 
     return True
@@ -90,31 +142,27 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 @callback
 def _add_default_code(entity: LockEntity, service_call: ServiceCall) -> dict[Any, Any]:
     data = remove_entity_service_fields(service_call)
-    code: str = data.pop(ATTR_CODE, "")
-    if not code:
-        code = entity._lock_option_default_code  # pylint: disable=protected-access
-    if entity.code_format_cmp and not entity.code_format_cmp.match(code):
-        raise ValueError(
-            f"Code '{code}' for locking {entity.entity_id} doesn't match pattern {entity.code_format}"
-        )
+    default_code = entity._lock_option_default_code  # pylint: disable=protected-access
+    code: str = data.get(ATTR_CODE) or default_code
+    if (code_format := entity.code_format) is not None:
+        # pylint: disable-next=protected-access
+        matcher = entity._get_code_format_matcher(code_format)
+        if not matcher(code):
+            raise ValueError(
+                f"Code '{code}' for locking {entity.entity_id} doesn't match pattern {code_format}"
+            )
     if code:
         data[ATTR_CODE] = code
+    elif ATTR_CODE in data:
+        del data[ATTR_CODE]
     return data
 
 
-async def _async_lock(entity: LockEntity, service_call: ServiceCall) -> None:
-    """Lock the lock."""
-    await entity.async_lock(**_add_default_code(entity, service_call))
-
-
-async def _async_unlock(entity: LockEntity, service_call: ServiceCall) -> None:
-    """Unlock the lock."""
-    await entity.async_unlock(**_add_default_code(entity, service_call))
-
-
-async def _async_open(entity: LockEntity, service_call: ServiceCall) -> None:
-    """Open the door latch."""
-    await entity.async_open(**_add_default_code(entity, service_call))
+async def _async_service(entity: LockEntity, service_call: ServiceCall) -> None:
+    """Lock, unlock or open the lock."""
+    await getattr(entity, _SERVICE_TO_METHOD[service_call.service])(
+        **_add_default_code(entity, service_call)
+    )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -147,7 +195,22 @@ class LockEntity(Entity):
     _attr_state: None = None
     _attr_supported_features: LockEntityFeature = LockEntityFeature(0)
     _lock_option_default_code: str = ""
-    __code_format_cmp: re.Pattern[str] | None = None
+    # True if none of the is_* state properties are overridden, so the state can be
+    # read from the _attr_is_* attributes directly, set by __init_subclass__
+    __state_from_attrs: bool = True
+    # The last used code format and its matcher, the code format is compared by
+    # identity as it's normally the same string object on every call
+    __code_format_matcher: tuple[str, Callable[[str], object]] | None = None
+    # The default code option and code format last read by _async_read_entity_options
+    __entity_options: tuple[str | None, str | None] | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Initialize a LockEntity subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.__state_from_attrs = all(
+            getattr(cls, prop) is getattr(LockEntity, prop)
+            for prop in _STATE_PROPERTIES
+        )
 
     @property
     def changed_by(self) -> str | None:
@@ -163,15 +226,20 @@ class LockEntity(Entity):
     @final
     def code_format_cmp(self) -> re.Pattern[str] | None:
         """Return a compiled code_format."""
-        if self.code_format is None:
-            self.__code_format_cmp = None
+        if (code_format := self.code_format) is None:
             return None
-        if (
-            not self.__code_format_cmp
-            or self.code_format != self.__code_format_cmp.pattern
-        ):
-            self.__code_format_cmp = re.compile(self.code_format)
-        return self.__code_format_cmp
+        return _compile_code_format(code_format)
+
+    @final
+    def _get_code_format_matcher(self, code_format: str) -> Callable[[str], object]:
+        """Return a function which checks if a code matches code_format."""
+        cached = self.__code_format_matcher
+        if cached is None or cached[0] is not code_format:
+            cached = self.__code_format_matcher = (
+                code_format,
+                _code_format_matcher(code_format),
+            )
+        return cached[1]
 
     @property
     def is_locked(self) -> bool | None:
@@ -199,7 +267,7 @@ class LockEntity(Entity):
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the lock."""
-        await self.hass.async_add_executor_job(ft.partial(self.lock, **kwargs))
+        await self.hass.async_add_executor_job(_executor_job(self.lock, kwargs))
 
     def unlock(self, **kwargs: Any) -> None:
         """Unlock the lock."""
@@ -207,7 +275,7 @@ class LockEntity(Entity):
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the lock."""
-        await self.hass.async_add_executor_job(ft.partial(self.unlock, **kwargs))
+        await self.hass.async_add_executor_job(_executor_job(self.unlock, kwargs))
 
     def open(self, **kwargs: Any) -> None:
         """Open the door latch."""
@@ -215,22 +283,33 @@ class LockEntity(Entity):
 
     async def async_open(self, **kwargs: Any) -> None:
         """Open the door latch."""
-        await self.hass.async_add_executor_job(ft.partial(self.open, **kwargs))
+        await self.hass.async_add_executor_job(_executor_job(self.open, kwargs))
 
     @final
     @property
     def state_attributes(self) -> dict[str, StateType]:
         """Return the state attributes."""
-        state_attr = {}
-        for prop, attr in PROP_TO_ATTR.items():
-            if (value := getattr(self, prop)) is not None:
-                state_attr[attr] = value
+        state_attr: dict[str, StateType] = {}
+        if (changed_by := self.changed_by) is not None:
+            state_attr[ATTR_CHANGED_BY] = changed_by
+        if (code_format := self.code_format) is not None:
+            state_attr[ATTR_CODE_FORMAT] = code_format
         return state_attr
 
     @final
     @property
     def state(self) -> str | None:
         """Return the state."""
+        if self.__state_from_attrs:
+            if self._attr_is_jammed:
+                return STATE_JAMMED
+            if self._attr_is_locking:
+                return STATE_LOCKING
+            if self._attr_is_unlocking:
+                return STATE_UNLOCKING
+            if (locked := self._attr_is_locked) is None:
+                return None
+            return STATE_LOCKED if locked else STATE_UNLOCKED
         if self.is_jammed:
             return STATE_JAMMED
         if self.is_locking:
@@ -249,6 +328,11 @@ class LockEntity(Entity):
     async def async_internal_added_to_hass(self) -> None:
         """Call when the sensor entity is added to hass."""
         await super().async_internal_added_to_hass()
+        # Prepare the code format matcher before the first service call, an invalid
+        # code format is reported when the lock is operated
+        if (code_format := self.code_format) is not None:
+            with suppress(re.error):
+                self._get_code_format_matcher(code_format)
         if not self.registry_entry:
             return
         self._async_read_entity_options()
@@ -266,10 +350,18 @@ class LockEntity(Entity):
         added to the state machine.
         """
         assert self.registry_entry
-        if (lock_options := self.registry_entry.options.get(DOMAIN)) and (
-            custom_default_lock_code := lock_options.get(CONF_DEFAULT_CODE)
-        ):
-            if self.code_format_cmp and self.code_format_cmp.match(
+        custom_default_lock_code: str | None = None
+        if lock_options := self.registry_entry.options.get(DOMAIN):
+            custom_default_lock_code = lock_options.get(CONF_DEFAULT_CODE)
+        code_format = self.code_format
+        # The registry entry options are copied on every update, compare the values
+        entity_options = (custom_default_lock_code, code_format)
+        if entity_options == self.__entity_options:
+            return
+        self.__entity_options = entity_options
+
+        if custom_default_lock_code:
+            if code_format is not None and self._get_code_format_matcher(code_format)(
                 custom_default_lock_code
             ):
                 self._lock_option_default_code = custom_default_lock_code
@@ -1,6 +1,7 @@
 """The tests for the lock component."""
 from __future__ import annotations
 
+import re
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -20,9 +21,8 @@ from homeassistant.components.lock import (
     STATE_UNLOCKING,
     LockEntity,
     LockEntityFeature,
-    _async_lock,
-    _async_open,
-    _async_unlock,
+    _async_service,
+    _code_format_matcher,
 )
 from homeassistant.core import HomeAssistant, ServiceCall
 import homeassistant.helpers.entity_registry as er
@@ -87,7 +87,7 @@ async def test_lock_states(hass: HomeAssistant) -> None:
     assert lock.is_locking
     assert lock.state == STATE_LOCKING
 
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
     assert lock.is_locked
     assert lock.state == STATE_LOCKED
 
@@ -95,7 +95,7 @@ async def test_lock_states(hass: HomeAssistant) -> None:
     assert lock.is_unlocking
     assert lock.state == STATE_UNLOCKING
 
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
     assert not lock.is_locked
     assert lock.state == STATE_UNLOCKED
 
@@ -189,12 +189,14 @@ async def test_lock_open_with_code(hass: HomeAssistant) -> None:
     assert lock.state_attributes == {"code_format": r"^\d{4}$"}
 
     with pytest.raises(ValueError):
-        await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
     with pytest.raises(ValueError):
-        await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
     with pytest.raises(ValueError):
-        await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "HELLO"}))
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "1234"}))
+        await _async_service(
+            lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "HELLO"})
+        )
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "1234"}))
     assert lock.calls_open.call_count == 1
 
 
@@ -203,16 +205,18 @@ async def test_lock_lock_with_code(hass: HomeAssistant) -> None:
     lock = MockLockEntity(code_format=r"^\d{4}$")
     lock.hass = hass
 
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "1234"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "1234"}))
     assert not lock.is_locked
 
     with pytest.raises(ValueError):
-        await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
     with pytest.raises(ValueError):
-        await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
     with pytest.raises(ValueError):
-        await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "HELLO"}))
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"}))
+        await _async_service(
+            lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "HELLO"})
+        )
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"}))
     assert lock.is_locked
 
 
@@ -221,18 +225,18 @@ async def test_lock_unlock_with_code(hass: HomeAssistant) -> None:
     lock = MockLockEntity(code_format=r"^\d{4}$")
     lock.hass = hass
 
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "1234"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"}))
     assert lock.is_locked
 
     with pytest.raises(ValueError):
-        await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
     with pytest.raises(ValueError):
-        await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
     with pytest.raises(ValueError):
-        await _async_unlock(
+        await _async_service(
             lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "HELLO"})
         )
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "1234"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "1234"}))
     assert not lock.is_locked
 
 
@@ -245,15 +249,15 @@ async def test_lock_with_illegal_code(hass: HomeAssistant) -> None:
     lock.hass = hass
 
     with pytest.raises(ValueError):
-        await _async_open(
+        await _async_service(
             lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "123456"})
         )
     with pytest.raises(ValueError):
-        await _async_lock(
+        await _async_service(
             lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "123456"})
         )
     with pytest.raises(ValueError):
-        await _async_unlock(
+        await _async_service(
             lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "123456"})
         )
 
@@ -265,18 +269,18 @@ async def test_lock_with_no_code(hass: HomeAssistant) -> None:
     )
     lock.hass = hass
 
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
     lock.calls_open.assert_called_with({})
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
     lock.calls_lock.assert_called_with({})
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
     lock.calls_unlock.assert_called_with({})
 
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
     lock.calls_open.assert_called_with({})
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
     lock.calls_lock.assert_called_with({})
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
     lock.calls_unlock.assert_called_with({})
 
 
@@ -292,18 +296,18 @@ async def test_lock_with_default_code(hass: HomeAssistant) -> None:
     assert lock.state_attributes == {"code_format": r"^\d{4}$"}
     assert lock._lock_option_default_code == "1234"
 
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
     lock.calls_open.assert_called_with({ATTR_CODE: "1234"})
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
     lock.calls_lock.assert_called_with({ATTR_CODE: "1234"})
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
     lock.calls_unlock.assert_called_with({ATTR_CODE: "1234"})
 
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: ""}))
     lock.calls_open.assert_called_with({ATTR_CODE: "1234"})
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: ""}))
     lock.calls_lock.assert_called_with({ATTR_CODE: "1234"})
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: ""}))
     lock.calls_unlock.assert_called_with({ATTR_CODE: "1234"})
 
 
@@ -316,11 +320,11 @@ async def test_lock_with_provided_and_default_code(hass: HomeAssistant) -> None:
     )
     lock.hass = hass
 
-    await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "4321"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {ATTR_CODE: "4321"}))
     lock.calls_open.assert_called_with({ATTR_CODE: "4321"})
-    await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "4321"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "4321"}))
     lock.calls_lock.assert_called_with({ATTR_CODE: "4321"})
-    await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "4321"}))
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {ATTR_CODE: "4321"}))
     lock.calls_unlock.assert_called_with({ATTR_CODE: "4321"})
 
 
@@ -337,8 +341,199 @@ async def test_lock_with_illegal_default_code(hass: HomeAssistant) -> None:
     assert lock._lock_option_default_code == "123456"
 
     with pytest.raises(ValueError):
-        await _async_open(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_OPEN, {}))
+    with pytest.raises(ValueError):
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
     with pytest.raises(ValueError):
-        await _async_lock(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {}))
+        await _async_service(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+
+
+@pytest.mark.parametrize(
+    ("code_format", "valid_code", "invalid_codes"),
+    [
+        (r"^\d{4}$", "1234", ["123", "12345", "12a4", "1234\n\n"]),
+        (r"^\d{4}$", "1234\n", ["\n1234"]),
+        (r"^\d{4,6}$", "123456", ["123", "1234567", "12 34"]),
+        (r"^[a-z]{4}$", "abcd", ["1234", "abcde"]),
+    ],
+)
+async def test_lock_code_format_matching(
+    hass: HomeAssistant, code_format: str, valid_code: str, invalid_codes: list[str]
+) -> None:
+    """Test codes are checked against the code format."""
+    lock = MockLockEntity(code_format=code_format)
+    lock.hass = hass
+
+    for code in invalid_codes:
+        with pytest.raises(ValueError):
+            await _async_service(
+                lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: code})
+            )
+    await _async_service(
+        lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: valid_code})
+    )
+    lock.calls_lock.assert_called_with({ATTR_CODE: valid_code})
+
+
+@pytest.mark.parametrize("code_format", [r"^\d{4}$", r"^\d{0,4}$", r"^\d{2,6}$"])
+@pytest.mark.parametrize(
+    "code",
+    ["", "1", "12", "1234", "123456", "1234567", "12a4", "1234\n", "1234\n\n", "١٢٣٤"],
+)
+def test_digits_code_format_matcher(code_format: str, code: str) -> None:
+    """Test digit-only code formats are matched like the regex engine does."""
+    assert bool(_code_format_matcher(code_format)(code)) == bool(
+        re.match(code_format, code)
+    )
+
+
+async def test_lock_invalid_code_format(hass: HomeAssistant) -> None:
+    """Test an invalid code format raises when checking a code."""
+    lock = MockLockEntity(code_format=r"^\d{6,4}$")
+    lock.hass = hass
+
+    with pytest.raises(re.error):
+        await _async_service(
+            lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"})
+        )
+
+
+async def test_lock_state_from_overridden_properties(hass: HomeAssistant) -> None:
+    """Test lock state when the state properties are overridden."""
+
+    class PropertyLockEntity(MockLockEntity):
+        """Mock lock which reports the state from properties."""
+
+        jammed = False
+
+        @property
+        def is_locked(self) -> bool | None:
+            """Return true if the lock is locked."""
+            return True
+
+        @property
+        def is_jammed(self) -> bool | None:
+            """Return true if the lock is jammed (incomplete locking)."""
+            return self.jammed
+
+    lock = PropertyLockEntity()
+    lock.hass = hass
+
+    assert lock.state == STATE_LOCKED
+    lock.jammed = True
+    assert lock.state == STATE_JAMMED
+
+
+async def test_lock_sync_methods(hass: HomeAssistant) -> None:
+    """Test the async methods run the sync methods in the executor."""
+
+    class SyncLockEntity(LockEntity):
+        """Mock lock implementing the sync methods."""
+
+        def __init__(self) -> None:
+            """Initialize mock lock entity."""
+            self.calls_lock = MagicMock()
+            self.calls_unlock = MagicMock()
+            self.calls_open = MagicMock()
+
+        def lock(self, **kwargs: Any) -> None:
+            """Lock the lock."""
+            self.calls_lock(kwargs)
+
+        def unlock(self, **kwargs: Any) -> None:
+            """Unlock the lock."""
+            self.calls_unlock(kwargs)
+
+        def open(self, **kwargs: Any) -> None:
+            """Open the door latch."""
+            self.calls_open(kwargs)
+
+    lock = SyncLockEntity()
+    lock.hass = hass
+
+    await lock.async_lock()
+    lock.calls_lock.assert_called_with({})
+    await lock.async_lock(**{ATTR_CODE: "1234"})
+    lock.calls_lock.assert_called_with({ATTR_CODE: "1234"})
+    await lock.async_unlock()
+    lock.calls_unlock.assert_called_with({})
+    await lock.async_unlock(**{ATTR_CODE: "1234"})
+    lock.calls_unlock.assert_called_with({ATTR_CODE: "1234"})
+    await lock.async_open()
+    lock.calls_open.assert_called_with({})
+    await lock.async_open(**{ATTR_CODE: "1234"})
+    lock.calls_open.assert_called_with({ATTR_CODE: "1234"})
+
+
+async def test_lock_code_format_changed(hass: HomeAssistant) -> None:
+    """Test codes are checked against the current code format."""
+    lock = MockLockEntity(code_format=r"^\d{4}$")
+    lock.hass = hass
+
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"}))
+
+    lock._attr_code_format = r"^\d{6}$"
     with pytest.raises(ValueError):
-        await _async_unlock(lock, ServiceCall(DOMAIN, SERVICE_UNLOCK, {}))
+        await _async_service(
+            lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "1234"})
+        )
+    await _async_service(lock, ServiceCall(DOMAIN, SERVICE_LOCK, {ATTR_CODE: "123456"}))
+    lock.calls_lock.assert_called_with({ATTR_CODE: "123456"})
+
+
+async def test_lock_added_with_invalid_code_format(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test a lock with an invalid code format is added and fails when operated."""
+    platform = getattr(hass.components, "test.lock")
+    platform.init(empty=True)
+    platform.ENTITIES["lock1"] = platform.MockLock(
+        name="Test",
+        code_format=r"^\d{6,4}$",
+        is_locked=True,
+        supported_features=LockEntityFeature.OPEN,
+        unique_id="very_unique",
+    )
+
+    assert await async_setup_component(hass, "lock", {"lock": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    state = hass.states.get("lock.test")
+    assert state is not None
+    assert state.state == STATE_LOCKED
+
+    with pytest.raises(re.error):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UNLOCK,
+            {"entity_id": "lock.test", ATTR_CODE: "1234"},
+            blocking=True,
+        )
+
+
+async def test_default_code_option_code_format_changed(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    enable_custom_integrations: None,
+) -> None:
+    """Test default code is checked again when only the code format changed."""
+    platform = getattr(hass.components, "test.lock")
+    platform.init(empty=True)
+
+    entry = entity_registry.async_get_or_create("lock", "test", "very_unique")
+    entity_registry.async_update_entity_options(
+        entry.entity_id, "lock", {CONF_DEFAULT_CODE: "1234"}
+    )
+    lock = platform.MockLock(name="Test", unique_id="very_unique")
+    lock._attr_code_format = r"^\d{6}$"
+    platform.ENTITIES["lock1"] = lock
+
+    assert await async_setup_component(hass, "lock", {"lock": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    assert lock._lock_option_default_code == ""
+
+    # The registry options are unchanged, only the code format
+    lock._attr_code_format = r"^\d{4}$"
+    lock.async_registry_entry_updated()
+    assert lock._lock_option_default_code == "1234"